@@ -3,22 +3,18 @@ Venezuelan Income Tax (ISLR) Calculator
 Calculates income tax based on Venezuelan tax brackets using Unidad Tributaria (UT)
 """
 
-from rich.console import Console
-
 from src.calculator import ISLRCalculator
-from src.config import load_config
+from src.config import get_config
 from src.console import ConsoleUI
 from src.i18n import t
-from src.models import Currency
 
 
 def main():
     """Main application entry point"""
-    console = Console()
-    ui = ConsoleUI(console)
+    ui = ConsoleUI()
 
     # Load configuration
-    config = load_config(console)
+    config = get_config(ui.console)
 
     # Initialize calculator
     calculator = ISLRCalculator(
@@ -51,10 +47,7 @@ def main():
             dependents = ui.get_number_of_dependents()
 
             # Convert to VES if needed
-            if currency == Currency.USD:
-                monthly_income_ves = calculator.usd_to_ves_convert(monthly_income)
-            else:
-                monthly_income_ves = monthly_income
+            monthly_income_ves = calculator.to_ves_convert(monthly_income, currency)
 
             annual_income_ves = monthly_income_ves * 12
 
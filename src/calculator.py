@@ -3,9 +3,66 @@ Calculator module for ISLR tax calculations
 Contains the ISLRCalculator class with all calculation methods
 """
 
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import partial
+from math import inf
+
 from src.i18n import t
 from src.models import CalculationStep, Currency, TaxBracket, TaxCalculationResult
 
+# Smallest income treated as non-zero when computing the effective rate
+_EPS = 1e-12
+
+
+def _calc_core(
+    inv_ut_value: float,
+    standard_deduction_ut: float,
+    min_ut_thresholds: tuple[float, ...],
+    rates: tuple[float, ...],
+    subtract_uts: tuple[float, ...],
+    annual_income_ves: float,
+) -> tuple[float, float, int, float]:
+    """
+    Pure numeric core of the tax calculation
+
+    Configuration comes first so a calculator can bind it once with partial.
+
+    Args:
+        inv_ut_value: Reciprocal of the current Unidad Tributaria value
+        standard_deduction_ut: Standard deduction in UT (reduces income)
+        min_ut_thresholds: Lower bound of each bracket in UT, sorted
+        rates: Tax rate of each bracket
+        subtract_uts: Subtrahend of each bracket in UT
+        annual_income_ves: Annual income in VES (Venezuelan Bolivares)
+
+    Returns:
+        Tuple of (annual_income_ut, taxable_income_ut, bracket_index,
+        tax_before_credits_ut). bracket_index is -1 if no bracket applies.
+    """
+    # Step 1: Convert income to UT
+    annual_income_ut = annual_income_ves * inv_ut_value
+
+    # Step 2: Apply standard deduction to income
+    taxable_income_ut = annual_income_ut - standard_deduction_ut
+
+    # Nothing left to tax: skip the bracket lookup entirely
+    if taxable_income_ut <= 0:
+        return annual_income_ut, 0.0, -1, 0.0
+
+    # Step 3: Find applicable tax bracket (last one starting at or below income)
+    bracket_index = bisect_right(min_ut_thresholds, taxable_income_ut) - 1
+
+    # Step 4: Calculate tax using bracket formula
+    if bracket_index >= 0:
+        # Tax = (Taxable Income × Rate) - Bracket Subtraction
+        tax_ut = (taxable_income_ut * rates[bracket_index]) - subtract_uts[bracket_index]
+        tax_before_credits_ut = tax_ut if tax_ut > 0 else 0.0
+    else:
+        tax_before_credits_ut = 0
+
+    return annual_income_ut, taxable_income_ut, bracket_index, tax_before_credits_ut
+
 
 class ISLRCalculator:
     """Venezuelan ISLR Tax Calculator"""
@@ -35,19 +92,49 @@ class ISLRCalculator:
         self.standard_deduction_ut = standard_deduction_ut
         self.taxpayer_credit_ut = taxpayer_credit_ut
         self.dependent_credit_ut = dependent_credit_ut
-        self.tax_brackets = tax_brackets
+        # Reciprocals so conversions out of VES multiply instead of divide
+        self._inv_ut_value = 1.0 / ut_value
+        self._inv_usd_rate = 1.0 / usd_to_ves
+
+        # Converter into VES for each input currency, resolved by lookup
+        self._to_ves_converters = {
+            Currency.VES: lambda amount: amount,
+            Currency.USD: self.usd_to_ves_convert,
+        }
+
+        self.tax_brackets = sorted(tax_brackets, key=lambda bracket: bracket.min_ut)
+
+        # Bracket columns as parallel tuples, so the hot path indexes plain
+        # floats instead of reading attributes off each TaxBracket
+        self._min_ut_thresholds = tuple(b.min_ut for b in self.tax_brackets)
+        self._rates = tuple(b.rate for b in self.tax_brackets)
+        self._subtract_uts = tuple(b.subtract_ut for b in self.tax_brackets)
+
+        # Numeric core specialized to this configuration: only income varies
+        self._compute_core = partial(
+            _calc_core,
+            self._inv_ut_value,
+            self.standard_deduction_ut,
+            self._min_ut_thresholds,
+            self._rates,
+            self._subtract_uts,
+        )
 
     def usd_to_ves_convert(self, amount: float) -> float:
         """Convert USD to VES"""
         return amount * self.usd_to_ves
 
+    def to_ves_convert(self, amount: float, currency: Currency) -> float:
+        """Convert an amount in the given currency to VES"""
+        return self._to_ves_converters[currency](amount)
+
     def ves_to_usd_convert(self, amount: float) -> float:
         """Convert VES to USD"""
-        return amount / self.usd_to_ves
+        return amount * self._inv_usd_rate
 
     def ves_to_ut_convert(self, amount: float) -> float:
         """Convert VES to UT"""
-        return amount / self.ut_value
+        return amount * self._inv_ut_value
 
     def ut_to_ves_convert(self, amount: float) -> float:
         """Convert UT to VES"""
@@ -70,63 +157,71 @@ class ISLRCalculator:
         Returns:
             TaxCalculationResult object with tax calculation details
         """
-        # Step 1: Convert income to UT
-        annual_income_ut = self.ves_to_ut_convert(annual_income_ves)
-
-        # Step 2: Apply standard deduction to income
-        taxable_income_ut = max(0, annual_income_ut - self.standard_deduction_ut)
-
-        # Step 3: Find applicable tax bracket
-        applicable_bracket = None
-        for bracket in self.tax_brackets:
-            if bracket.min_ut <= taxable_income_ut < bracket.max_ut:
-                applicable_bracket = bracket
-                break
-
-        # If no bracket found, use the highest bracket
-        if applicable_bracket is None and taxable_income_ut > 0:
-            applicable_bracket = self.tax_brackets[-1]
-
-        # Step 4: Calculate tax using bracket formula
-        if applicable_bracket and taxable_income_ut > 0:
-            # Tax = (Taxable Income × Rate) - Bracket Subtraction
-            tax_before_credits_ut = max(
-                0,
-                (taxable_income_ut * applicable_bracket.rate)
-                - applicable_bracket.subtract_ut,
-            )
-        else:
-            tax_before_credits_ut = 0
+        # Steps 1-4: UT conversion, deduction, bracket lookup and bracket tax
+        annual_income_ut, taxable_income_ut, bracket_index, tax_before_credits_ut = (
+            self._compute_core(annual_income_ves)
+        )
 
         # Step 5: Apply tax credits (taxpayer + dependents)
         dependents_credit_ut = dependents * self.dependent_credit_ut
         taxpayer_credit_ut = self.taxpayer_credit_ut
         total_credits_ut = taxpayer_credit_ut + dependents_credit_ut
 
+        # Fast path: income within the standard deduction owes no tax
+        if bracket_index < 0:
+            return TaxCalculationResult(
+                annual_income_ves=annual_income_ves,
+                annual_income_usd=annual_income_ves * self._inv_usd_rate,
+                income_ut=annual_income_ut,
+                standard_deduction_ut=self.standard_deduction_ut,
+                dependents=dependents,
+                dependents_credit_ut=dependents_credit_ut,
+                taxpayer_credit_ut=taxpayer_credit_ut,
+                taxable_income_ut=taxable_income_ut,
+                bracket_rate=0,
+                total_tax_ut=0.0,
+                total_tax_ves=0.0,
+                total_tax_usd=0.0,
+                net_income_ves=annual_income_ves,
+                net_income_usd=annual_income_ves * self._inv_usd_rate,
+                effective_rate=0,
+                currency=currency,
+                usd_rate=self.usd_to_ves,
+                tax_before_credits_ut=0.0,
+                applicable_bracket=None,
+                total_credits_ut=total_credits_ut,
+            )
+
+        applicable_bracket = self.tax_brackets[bracket_index]
+
         # Final tax after credits
-        total_tax_ut = max(0, tax_before_credits_ut - total_credits_ut)
+        tax_after_credits_ut = tax_before_credits_ut - total_credits_ut
+        total_tax_ut = tax_after_credits_ut if tax_after_credits_ut > 0 else 0.0
 
         # Step 6: Convert tax to VES and USD
-        total_tax_ves = self.ut_to_ves_convert(total_tax_ut)
-        total_tax_usd = self.ves_to_usd_convert(total_tax_ves)
+        inv_usd_rate = self._inv_usd_rate
+        total_tax_ves = total_tax_ut * self.ut_value
+        total_tax_usd = total_tax_ves * inv_usd_rate
 
         # Step 7: Calculate net income and effective rate
         net_income_ves = annual_income_ves - total_tax_ves
-        net_income_usd = self.ves_to_usd_convert(net_income_ves)
+        net_income_usd = net_income_ves * inv_usd_rate
         effective_rate = (
-            (total_tax_ves / annual_income_ves * 100) if annual_income_ves > 0 else 0
+            total_tax_ves
+            * 100.0
+            / (annual_income_ves if annual_income_ves > _EPS else 1.0)
         )
 
         return TaxCalculationResult(
             annual_income_ves=annual_income_ves,
-            annual_income_usd=self.ves_to_usd_convert(annual_income_ves),
+            annual_income_usd=annual_income_ves * inv_usd_rate,
             income_ut=annual_income_ut,
             standard_deduction_ut=self.standard_deduction_ut,
             dependents=dependents,
             dependents_credit_ut=dependents_credit_ut,
             taxpayer_credit_ut=taxpayer_credit_ut,
             taxable_income_ut=taxable_income_ut,
-            bracket_rate=applicable_bracket.rate * 100 if applicable_bracket else 0,
+            bracket_rate=applicable_bracket.rate * 100,
             total_tax_ut=total_tax_ut,
             total_tax_ves=total_tax_ves,
             total_tax_usd=total_tax_usd,
@@ -140,6 +235,29 @@ class ISLRCalculator:
             total_credits_ut=total_credits_ut,
         )
 
+    def calculate_tax_batch(
+        self,
+        annual_incomes_ves: Iterable[float],
+        currency: Currency,
+        dependents: int = 0,
+    ) -> list[TaxCalculationResult]:
+        """
+        Calculate income tax for several annual incomes at once
+
+        Args:
+            annual_incomes_ves: Annual incomes in VES (Venezuelan Bolivares)
+            currency: Currency used for input (VES or USD)
+            dependents: Number of direct dependents applied to every income
+
+        Returns:
+            List of TaxCalculationResult objects, in input order
+        """
+        calculate_tax = self.calculate_tax
+        return [
+            calculate_tax(annual_income_ves, currency, dependents)
+            for annual_income_ves in annual_incomes_ves
+        ]
+
     def get_calculation_breakdown(
         self, result: TaxCalculationResult
     ) -> list[CalculationStep]:
@@ -176,7 +294,7 @@ class ISLRCalculator:
         # Step 3: Identify tax bracket and calculate tax
         if result.applicable_bracket and result.taxable_income_ut > 0:
             bracket = result.applicable_bracket
-            max_ut = "∞" if bracket.max_ut == float("inf") else f"{bracket.max_ut:,.0f}"
+            max_ut = "∞" if bracket.max_ut == inf else f"{bracket.max_ut:,.0f}"
             steps.append(
                 CalculationStep(
                     step="3",
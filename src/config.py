@@ -4,17 +4,19 @@ Handles loading of environment variables and configuration files
 """
 
 import csv
-import os
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
-from rich.console import Console
-
+from src.env import getenv
 from src.i18n import t
 from src.models import TaxBracket
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 @dataclass
 class Config:
@@ -28,117 +30,82 @@ class Config:
     tax_brackets: list[TaxBracket]
 
 
-def load_config(console: Console) -> Config:
-    """Load configuration from environment variables and files"""
-    load_dotenv()
-
-    # Get UT_VALUE from environment variable
-    ut_value_str = os.getenv("UT_VALUE")
-    if ut_value_str is None:
-        console.print(f"[bold red]{t('config_errors.ut_value_not_set')}[/bold red]")
-        console.print(f"[yellow]{t('config_errors.please_set_ut_value')}[/yellow]")
-        console.print(f"[dim]{t('config_errors.example_ut_value')}[/dim]")
-        sys.exit(1)
+# Config field, environment variable and i18n key stem of each numeric setting
+_ENV_SETTINGS = (
+    ("ut_value", "UT_VALUE", "ut_value"),
+    ("usd_to_ves", "USD_TO_VES", "usd_rate"),
+    ("standard_deduction_ut", "STANDARD_DEDUCTION_UT", "standard_deduction"),
+    ("taxpayer_credit_ut", "TAXPAYER_CREDIT_UT", "taxpayer_credit"),
+    ("dependent_credit_ut", "DEPENDENT_CREDIT_UT", "dependent_credit"),
+)
 
-    try:
-        ut_value = float(ut_value_str)
-    except ValueError:
-        console.print(
-            f"[bold red]{t('config_errors.ut_value_invalid', value=ut_value_str)}[/bold red]"
-        )
-        sys.exit(1)
+# Process-wide configuration, loaded once by get_config
+_config: Config | None = None
+_config_lock = threading.Lock()
 
-    # Get USD_TO_VES from environment variable
-    usd_to_ves_str = os.getenv("USD_TO_VES")
-    if usd_to_ves_str is None:
-        console.print(f"[bold red]{t('config_errors.usd_rate_not_set')}[/bold red]")
-        console.print(f"[yellow]{t('config_errors.please_set_usd_rate')}[/yellow]")
-        console.print(f"[dim]{t('config_errors.example_usd_rate')}[/dim]")
-        sys.exit(1)
 
-    try:
-        usd_to_ves = float(usd_to_ves_str)
-    except ValueError:
-        console.print(
-            f"[bold red]{t('config_errors.usd_rate_invalid', value=usd_to_ves_str)}[/bold red]"
-        )
-        sys.exit(1)
+def get_config(console: "Console") -> Config:
+    """
+    Get the process-wide configuration, loading it on first use
 
-    # Get STANDARD_DEDUCTION_UT from environment variable
-    standard_deduction_ut_str = os.getenv("STANDARD_DEDUCTION_UT")
-    if standard_deduction_ut_str is None:
-        console.print(
-            f"[bold red]{t('config_errors.standard_deduction_not_set')}[/bold red]"
-        )
-        console.print(
-            f"[yellow]{t('config_errors.please_set_standard_deduction')}[/yellow]"
-        )
-        console.print(f"[dim]{t('config_errors.example_standard_deduction')}[/dim]")
-        sys.exit(1)
+    Args:
+        console: Console instance for output while loading
 
-    try:
-        standard_deduction_ut = float(standard_deduction_ut_str)
-    except ValueError:
-        console.print(
-            f"[bold red]{t('config_errors.standard_deduction_invalid', value=standard_deduction_ut_str)}[/bold red]"
-        )
-        sys.exit(1)
+    Returns:
+        Config shared by every caller in this process
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = load_config(console)
+    return _config
 
-    # Get TAXPAYER_CREDIT_UT from environment variable
-    taxpayer_credit_ut_str = os.getenv("TAXPAYER_CREDIT_UT")
-    if taxpayer_credit_ut_str is None:
-        console.print(
-            f"[bold red]{t('config_errors.taxpayer_credit_not_set')}[/bold red]"
-        )
-        console.print(
-            f"[yellow]{t('config_errors.please_set_taxpayer_credit')}[/yellow]"
-        )
-        console.print(f"[dim]{t('config_errors.example_taxpayer_credit')}[/dim]")
-        sys.exit(1)
 
-    try:
-        taxpayer_credit_ut = float(taxpayer_credit_ut_str)
-    except ValueError:
-        console.print(
-            f"[bold red]{t('config_errors.taxpayer_credit_invalid', value=taxpayer_credit_ut_str)}[/bold red]"
-        )
-        sys.exit(1)
+def load_config(console: "Console") -> Config:
+    """Load configuration from environment variables and files"""
+    # Read and validate every numeric setting from the environment
+    values = {
+        field: _require_float_env(console, env_name, key)
+        for field, env_name, key in _ENV_SETTINGS
+    }
 
-    # Get DEPENDENT_CREDIT_UT from environment variable
-    dependent_credit_ut_str = os.getenv("DEPENDENT_CREDIT_UT")
-    if dependent_credit_ut_str is None:
-        console.print(
-            f"[bold red]{t('config_errors.dependent_credit_not_set')}[/bold red]"
-        )
-        console.print(
-            f"[yellow]{t('config_errors.please_set_dependent_credit')}[/yellow]"
-        )
-        console.print(f"[dim]{t('config_errors.example_dependent_credit')}[/dim]")
+    # Load tax brackets
+    tax_brackets = load_tax_brackets_from_csv(console)
+
+    return Config(**values, tax_brackets=tax_brackets)
+
+
+def _require_float_env(console: "Console", env_name: str, key: str) -> float:
+    """
+    Read a required numeric environment variable, exiting if missing or invalid
+
+    Args:
+        console: Console instance for output
+        env_name: Name of the environment variable
+        key: i18n key stem for the variable's config_errors messages
+
+    Returns:
+        Value of the environment variable as float
+    """
+    raw_value = getenv(env_name)
+    if raw_value is None:
+        _print_message(console, "bold red", f"config_errors.{key}_not_set")
+        _print_message(console, "yellow", f"config_errors.please_set_{key}")
+        _print_message(console, "dim", f"config_errors.example_{key}")
         sys.exit(1)
 
     try:
-        dependent_credit_ut = float(dependent_credit_ut_str)
+        return float(raw_value)
     except ValueError:
-        console.print(
-            f"[bold red]{t('config_errors.dependent_credit_invalid', value=dependent_credit_ut_str)}[/bold red]"
+        _print_message(
+            console, "bold red", f"config_errors.{key}_invalid", value=raw_value
         )
         sys.exit(1)
 
-    # Load tax brackets
-    tax_brackets = load_tax_brackets_from_csv(console)
-
-    return Config(
-        ut_value=ut_value,
-        usd_to_ves=usd_to_ves,
-        standard_deduction_ut=standard_deduction_ut,
-        taxpayer_credit_ut=taxpayer_credit_ut,
-        dependent_credit_ut=dependent_credit_ut,
-        tax_brackets=tax_brackets,
-    )
-
 
 def load_tax_brackets_from_csv(
-    console: Console, filename: str = "tax_brackets.csv"
+    console: "Console", filename: str = "tax_brackets.csv"
 ) -> list[TaxBracket]:
     """
     Load tax brackets from a CSV file
@@ -152,39 +119,51 @@ def load_tax_brackets_from_csv(
     """
     brackets = []
     csv_path = Path(__file__).parent.parent / filename
-    print(csv_path)
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                bracket = TaxBracket(
-                    min_ut=float(row["min_ut"]),
-                    max_ut=float("inf")
-                    if row["max_ut"].lower() == "inf"
-                    else float(row["max_ut"]),
-                    rate=float(row["rate"]),
-                    subtract_ut=float(row["subtract_ut"]),
+        with open(csv_path, "r", encoding="utf-8", newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is not None:
+                # Resolve column positions once from the header row
+                min_col, max_col, rate_col, subtract_col = map(
+                    header.index, ("min_ut", "max_ut", "rate", "subtract_ut")
                 )
-                brackets.append(bracket)
+                for row in reader:
+                    if not row:
+                        continue
+                    # float() parses "inf" (any case) natively
+                    bracket = TaxBracket(
+                        min_ut=float(row[min_col]),
+                        max_ut=float(row[max_col]),
+                        rate=float(row[rate_col]),
+                        subtract_ut=float(row[subtract_col]),
+                    )
+                    brackets.append(bracket)
 
         if not brackets:
-            console.print(
-                f"[bold red]{t('config_errors.no_brackets_found', filename=filename)}[/bold red]"
+            _print_message(
+                console, "bold red", "config_errors.no_brackets_found", filename=filename
             )
             sys.exit(1)
 
         return brackets
 
     except FileNotFoundError:
-        console.print(
-            f"[bold red]{t('config_errors.brackets_file_not_found', filename=filename)}[/bold red]"
+        _print_message(
+            console,
+            "bold red",
+            "config_errors.brackets_file_not_found",
+            filename=filename,
         )
-        console.print(f"[yellow]{t('config_errors.ensure_csv_exists')}[/yellow]")
+        _print_message(console, "yellow", "config_errors.ensure_csv_exists")
         sys.exit(1)
-    except (KeyError, ValueError) as e:
-        console.print(
-            f"[bold red]{t('config_errors.invalid_csv_format', error=e)}[/bold red]"
-        )
-        console.print(f"[yellow]{t('config_errors.expected_columns')}[/yellow]")
+    except (IndexError, ValueError) as e:
+        _print_message(console, "bold red", "config_errors.invalid_csv_format", error=e)
+        _print_message(console, "yellow", "config_errors.expected_columns")
         sys.exit(1)
+
+
+def _print_message(console: "Console", style: str, key: str, **kwargs):
+    """Print a translated message wrapped in the given Rich style"""
+    console.print(f"[{style}]{t(key, **kwargs)}[/{style}]")
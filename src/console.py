@@ -3,6 +3,9 @@ Console module for ISLR Calculator
 Handles all UI rendering, prompts, and display logic
 """
 
+import re
+from math import inf
+
 import questionary
 from questionary import Choice
 from rich import box
@@ -14,6 +17,27 @@ from rich.text import Text
 from src.i18n import t
 from src.models import CalculationStep, Currency, TaxBracket, TaxCalculationResult
 
+# Income as typed by the user: optional sign, digits with "," or " " as
+# thousands separators and an optional decimal part
+_INCOME_RE = re.compile(r"\s*-?[\d, ]*(?:\.\d*)?\s*")
+# Removes thousands separators before converting income to float
+_INCOME_STRIP_TABLE = str.maketrans("", "", ", ")
+
+# Prompt style shared by every ConsoleUI instance
+_QSTYLE = questionary.Style(
+    [
+        ("qmark", "fg:cyan bold"),
+        ("question", "bold"),
+        ("answer", "fg:cyan bold"),
+        ("pointer", "fg:cyan bold"),
+        ("highlighted", "fg:cyan bold"),
+        ("selected", "fg:cyan"),
+        ("separator", "fg:#6C6C6C"),
+        ("instruction", ""),
+        ("text", ""),
+    ]
+)
+
 
 class ConsoleUI:
     """Console UI handler for ISLR Calculator"""
@@ -26,19 +50,20 @@ class ConsoleUI:
             console: Optional Rich Console instance. Creates a new one if not provided.
         """
         self.console = console if console else Console()
-        self.qstyle = questionary.Style(
-            [
-                ("qmark", "fg:cyan bold"),
-                ("question", "bold"),
-                ("answer", "fg:cyan bold"),
-                ("pointer", "fg:cyan bold"),
-                ("highlighted", "fg:cyan bold"),
-                ("selected", "fg:cyan"),
-                ("separator", "fg:#6C6C6C"),
-                ("instruction", ""),
-                ("text", ""),
-            ]
-        )
+        self.qstyle = _QSTYLE
+
+        # Prompt choices are static, so build them once per instance
+        self._menu_choices = [
+            Choice(t("menu.calculate_tax"), value="1"),
+            Choice(t("menu.view_brackets"), value="2"),
+            Choice(t("menu.exit"), value="3"),
+        ]
+        self._currency_choices = [
+            Choice(t("input.currency_ves"), value=Currency.VES),
+            Choice(t("input.currency_usd"), value=Currency.USD),
+        ]
+        # (cache key, table) for the last rendered tax brackets table
+        self._brackets_table_cache: tuple[tuple, Table] | None = None
 
     def clear(self):
         """Clear the console"""
@@ -89,11 +114,7 @@ class ConsoleUI:
         """
         choice = questionary.select(
             t("menu.prompt"),
-            choices=[
-                Choice(t("menu.calculate_tax"), value="1"),
-                Choice(t("menu.view_brackets"), value="2"),
-                Choice(t("menu.exit"), value="3"),
-            ],
+            choices=self._menu_choices,
             style=self.qstyle,
         ).ask()
 
@@ -138,10 +159,7 @@ class ConsoleUI:
         # Ask for currency first
         currency = questionary.select(
             t("input.currency_prompt"),
-            choices=[
-                Choice(t("input.currency_ves"), value=Currency.VES),
-                Choice(t("input.currency_usd"), value=Currency.USD),
-            ],
+            choices=self._currency_choices,
             style=self.qstyle,
         ).ask()
 
@@ -152,16 +170,7 @@ class ConsoleUI:
             try:
                 income_str = questionary.text(
                     t("input.income_prompt", currency=currency),
-                    validate=lambda text: text.replace(",", "")
-                    .replace(" ", "")
-                    .replace(".", "", 1)
-                    .replace("-", "", 1)
-                    .isdigit()
-                    or text.replace(",", "")
-                    .replace(" ", "")
-                    .replace(".", "", 1)
-                    .replace("-", "", 1)
-                    == ""
+                    validate=lambda text: _INCOME_RE.fullmatch(text) is not None
                     or t("errors.enter_valid_number"),
                     style=self.qstyle,
                     default="",
@@ -170,7 +179,7 @@ class ConsoleUI:
                 if income_str is None:
                     return 0, currency
 
-                income = float(income_str.replace(",", "").replace(" ", ""))
+                income = float(income_str.translate(_INCOME_STRIP_TABLE))
                 if income < 0:
                     self.console.print(f"[red]{t('errors.negative_income')}[/red]")
                     continue
@@ -180,6 +189,22 @@ class ConsoleUI:
 
     def display_tax_brackets(self, tax_brackets: list[TaxBracket], ut_value: float):
         """Display the tax brackets table"""
+        # Brackets and UT value don't change after config load, so the table
+        # is built once and reprinted on later views
+        cache_key = (tuple(tax_brackets), ut_value)
+        if (
+            self._brackets_table_cache is None
+            or self._brackets_table_cache[0] != cache_key
+        ):
+            table = self._build_tax_brackets_table(tax_brackets, ut_value)
+            self._brackets_table_cache = (cache_key, table)
+
+        self.console.print(self._brackets_table_cache[1])
+
+    def _build_tax_brackets_table(
+        self, tax_brackets: list[TaxBracket], ut_value: float
+    ) -> Table:
+        """Build the tax brackets table"""
         table = Table(title=t("brackets.title"), box=box.ROUNDED)
 
         table.add_column(t("brackets.income_range_ut"), style="cyan", justify="right")
@@ -187,23 +212,22 @@ class ConsoleUI:
         table.add_column(t("brackets.tax_rate"), style="magenta", justify="center")
         table.add_column(t("brackets.subtract_ut"), style="yellow", justify="right")
 
-        for bracket in tax_brackets:
-            min_ves = f"{bracket.min_ut * ut_value:,.2f}"
-            max_ves = (
-                "∞"
-                if bracket.max_ut == float("inf")
-                else f"{bracket.max_ut * ut_value:,.2f}"
-            )
-            max_ut = "∞" if bracket.max_ut == float("inf") else f"{bracket.max_ut:,.0f}"
-
-            table.add_row(
+        def format_row(bracket: TaxBracket) -> tuple[str, str, str, str]:
+            """Format one bracket, checking for the open top bracket once"""
+            is_open_top = bracket.max_ut == inf
+            max_ut = "∞" if is_open_top else f"{bracket.max_ut:,.0f}"
+            max_ves = "∞" if is_open_top else f"{bracket.max_ut * ut_value:,.2f}"
+            return (
                 f"{bracket.min_ut:,.0f} - {max_ut}",
-                f"{min_ves} - {max_ves}",
+                f"{bracket.min_ut * ut_value:,.2f} - {max_ves}",
                 f"{bracket.rate * 100:.0f}%",
                 f"{bracket.subtract_ut:,.0f} UT",
             )
 
-        self.console.print(table)
+        for row in map(format_row, tax_brackets):
+            table.add_row(*row)
+
+        return table
 
     def display_results(self, result: TaxCalculationResult):
         """Display the tax calculation results in a formatted panel"""
@@ -212,51 +236,55 @@ class ConsoleUI:
         results_table.add_column("Label", style="bold cyan")
         results_table.add_column("Value", style="bold white")
 
-        results_table.add_row(
-            t("results.annual_income_ves"), f"{result.annual_income_ves:,.2f} Bs."
-        )
-        results_table.add_row(
-            t("results.annual_income_usd"), f"${result.annual_income_usd:,.2f}"
-        )
-        results_table.add_row(t("results.income_ut"), f"{result.income_ut:,.2f} UT")
-        results_table.add_row(
-            t("results.standard_deduction"), f"{result.standard_deduction_ut:,.2f} UT"
-        )
-        results_table.add_row(
-            t("results.taxable_income"), f"{result.taxable_income_ut:,.2f} UT"
-        )
-        results_table.add_row(t("results.marginal_rate"), f"{result.bracket_rate:.0f}%")
-        results_table.add_row(
-            t("results.taxpayer_credit"), f"{result.taxpayer_credit_ut:.2f} UT"
-        )
+        rows = [
+            (t("results.annual_income_ves"), f"{result.annual_income_ves:,.2f} Bs."),
+            (t("results.annual_income_usd"), f"${result.annual_income_usd:,.2f}"),
+            (t("results.income_ut"), f"{result.income_ut:,.2f} UT"),
+            (
+                t("results.standard_deduction"),
+                f"{result.standard_deduction_ut:,.2f} UT",
+            ),
+            (t("results.taxable_income"), f"{result.taxable_income_ut:,.2f} UT"),
+            (t("results.marginal_rate"), f"{result.bracket_rate:.0f}%"),
+            (t("results.taxpayer_credit"), f"{result.taxpayer_credit_ut:.2f} UT"),
+        ]
         if result.dependents > 0:
-            results_table.add_row(
-                t("results.dependent_credits", count=result.dependents),
-                f"{result.dependents_credit_ut:,.2f} UT",
+            rows.append(
+                (
+                    t("results.dependent_credits", count=result.dependents),
+                    f"{result.dependents_credit_ut:,.2f} UT",
+                )
             )
-        results_table.add_row("", "")
-        results_table.add_row(
-            t("results.total_tax_ut"), f"[bold yellow]{result.total_tax_ut:,.2f} UT[/]"
-        )
-        results_table.add_row(
-            t("results.total_tax_ves"),
-            f"[bold yellow]{result.total_tax_ves:,.2f} Bs.[/]",
-        )
-        results_table.add_row(
-            t("results.total_tax_usd"), f"[bold yellow]${result.total_tax_usd:,.2f}[/]"
-        )
-        results_table.add_row("", "")
-        results_table.add_row(
-            t("results.effective_rate"),
-            f"[bold magenta]{result.effective_rate:.2f}%[/]",
-        )
-        results_table.add_row(
-            t("results.net_income_ves"),
-            f"[bold green]{result.net_income_ves:,.2f} Bs.[/]",
-        )
-        results_table.add_row(
-            t("results.net_income_usd"), f"[bold green]${result.net_income_usd:,.2f}[/]"
-        )
+        rows += [
+            ("", ""),
+            (
+                t("results.total_tax_ut"),
+                f"[bold yellow]{result.total_tax_ut:,.2f} UT[/]",
+            ),
+            (
+                t("results.total_tax_ves"),
+                f"[bold yellow]{result.total_tax_ves:,.2f} Bs.[/]",
+            ),
+            (
+                t("results.total_tax_usd"),
+                f"[bold yellow]${result.total_tax_usd:,.2f}[/]",
+            ),
+            ("", ""),
+            (
+                t("results.effective_rate"),
+                f"[bold magenta]{result.effective_rate:.2f}%[/]",
+            ),
+            (
+                t("results.net_income_ves"),
+                f"[bold green]{result.net_income_ves:,.2f} Bs.[/]",
+            ),
+            (
+                t("results.net_income_usd"),
+                f"[bold green]${result.net_income_usd:,.2f}[/]",
+            ),
+        ]
+        for row in rows:
+            results_table.add_row(*row)
 
         panel = Panel(
             results_table,
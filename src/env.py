@@ -0,0 +1,25 @@
+"""
+Environment module for ISLR Calculator
+Loads the .env file on first use and reads environment variables at call time
+"""
+
+import os
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """Load .env into the process environment the first time it is needed"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        # Imported here so modules that never read the environment skip dotenv
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """Read an environment variable, including values loaded from .env"""
+    _load_dotenv_once()
+    return os.environ.get(name, default)
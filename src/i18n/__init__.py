@@ -4,21 +4,18 @@ Loads translations from JSON files based on ISLR_LANG environment variable
 """
 
 import json
-import os
 from pathlib import Path
 
-from dotenv import load_dotenv
+from src.env import getenv
 
-load_dotenv()
-
-_translations = {}
-_current_language = os.getenv("ISLR_LANG", "en")
+_translations: dict[str, str] | None = None
+_current_language: str | None = None
 
 
 def load_translations():
     """Load translations for current language"""
     locale_dir = Path(__file__).parent / "locales"
-    locale_file = locale_dir / f"{_current_language}.json"
+    locale_file = locale_dir / f"{get_current_language()}.json"
 
     # Fallback to English if language file doesn't exist
     if not locale_file.exists():
@@ -28,7 +25,16 @@ def load_translations():
         return json.load(f)
 
 
-_translations = load_translations()
+def flatten_translations(tree: dict, prefix: str = "") -> dict[str, str]:
+    """Flatten nested translations into a dict keyed by dot-notation path"""
+    flat = {}
+    for name, value in tree.items():
+        path = f"{prefix}{name}"
+        if isinstance(value, dict):
+            flat.update(flatten_translations(value, f"{path}."))
+        elif isinstance(value, str):
+            flat[path] = value
+    return flat
 
 
 def t(key: str, **kwargs) -> str:
@@ -47,21 +53,23 @@ def t(key: str, **kwargs) -> str:
         t("input.income_prompt", currency="USD")
         t("results.dependent_credits", count=2)
     """
-    keys = key.split(".")
-    value = _translations
+    global _translations
+    # Translations are loaded on first use rather than at import
+    if _translations is None:
+        _translations = flatten_translations(load_translations())
 
-    for k in keys:
-        if isinstance(value, dict):
-            value = value.get(k, key)
-        else:
-            return key
+    value = _translations.get(key, key)
 
-    if isinstance(value, str) and kwargs:
+    if kwargs:
         return value.format(**kwargs)
 
-    return value if isinstance(value, str) else key
+    return value
 
 
 def get_current_language() -> str:
     """Get the current language code"""
+    global _current_language
+    # ISLR_LANG is read on first use rather than at import
+    if _current_language is None:
+        _current_language = getenv("ISLR_LANG", "en")
     return _current_language
@@ -14,7 +14,7 @@ class Currency(StrEnum):
     USD = "USD"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaxBracket:
     """Tax bracket definition"""
 
@@ -24,7 +24,7 @@ class TaxBracket:
     subtract_ut: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxCalculationResult:
     """Complete result of tax calculation"""
 
@@ -51,7 +51,7 @@ class TaxCalculationResult:
     total_credits_ut: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CalculationStep:
     """A single step in the tax calculation breakdown"""
 